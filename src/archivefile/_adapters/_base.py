@@ -82,6 +82,8 @@ class BaseArchiveAdapter(Protocol):
 
     def get_names(self) -> tuple[str, ...]: ...
 
+    def __contains__(self, member: StrPath | ArchiveMember) -> bool: ...
+
     def print_tree(
         self,
         *,
@@ -102,11 +104,17 @@ class BaseArchiveAdapter(Protocol):
     def extract(self, member: StrPath | ArchiveMember, *, destination: StrPath = Path.cwd()) -> Path: ...
 
     def extractall(
-        self, *, destination: StrPath = Path.cwd(), members: CollectionOf[StrPath | ArchiveMember] | None = None
+        self,
+        *,
+        destination: StrPath = Path.cwd(),
+        members: CollectionOf[StrPath | ArchiveMember] | None = None,
+        workers: int | None = None,
     ) -> Path: ...
 
     def read_bytes(self, member: StrPath | ArchiveMember) -> bytes: ...
 
+    def read_many(self, members: CollectionOf[StrPath | ArchiveMember]) -> dict[str, bytes]: ...
+
     def read_text(
         self,
         member: StrPath | ArchiveMember,
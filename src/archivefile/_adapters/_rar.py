@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, overload
 
 from archivefile._adapters._base import BaseArchiveAdapter
 from archivefile._models import ArchiveMember
-from archivefile._utils import get_member_name, realpath
+from archivefile._utils import ensure_destination, get_member_name, realpath, validate_members
 from rarfile import NoRarEntry, RarFile
 
 if TYPE_CHECKING:
@@ -55,9 +56,12 @@ class RarFileAdapter(BaseArchiveAdapter):
         self._file = realpath(file)
         self._mode = mode[0]
         self._password = password
+        self._kwargs = kwargs
 
         if self._mode == "r":
             self._rarfile = RarFile(self._file, mode=self._mode, **kwargs)
+            self._name_tuple: tuple[str, ...] | None = None
+            self._names: frozenset[str] | None = None
         else:
             raise NotImplementedError('Cannot write to a rar file. Rar files only support mode="r"!')
 
@@ -95,6 +99,12 @@ class RarFileAdapter(BaseArchiveAdapter):
     def adapter(self) -> str:
         return self.__class__.__name__
 
+    def _name_set(self) -> frozenset[str]:
+        # RarFile is read-only, so the names can never change once we've looked them up
+        if self._names is None:
+            self._names = frozenset(self.get_names())
+        return self._names
+
     def get_member(self, member: StrPath | ArchiveMember) -> ArchiveMember:
         name = get_member_name(member)
 
@@ -105,7 +115,7 @@ class RarFileAdapter(BaseArchiveAdapter):
         except NoRarEntry:
             raise KeyError(f"{name} not found in {self._file}")
 
-        is_dir = True if rarinfo.filename.endswith("/") else False
+        is_dir = rarinfo.filename.endswith("/")
         return ArchiveMember(
             name=rarinfo.filename,
             size=rarinfo.file_size,
@@ -118,18 +128,25 @@ class RarFileAdapter(BaseArchiveAdapter):
 
     def get_members(self) -> Generator[ArchiveMember]:
         for rarinfo in self._rarfile.infolist():
+            is_dir = rarinfo.filename.endswith("/")
             yield ArchiveMember(
                 name=rarinfo.filename,
                 size=rarinfo.file_size,
                 compressed_size=rarinfo.compress_size,
                 datetime=datetime(*rarinfo.date_time),
                 checksum=rarinfo.CRC,
-                is_dir=True if rarinfo.filename.endswith("/") else False,
-                is_file=False if rarinfo.filename.endswith("/") else True,
+                is_dir=is_dir,
+                is_file=not is_dir,
             )
 
     def get_names(self) -> tuple[str, ...]:
-        return tuple(self._rarfile.namelist())
+        # RarFile is read-only, so we can hand out the same tuple every time instead of rebuilding it
+        if self._name_tuple is None:
+            self._name_tuple = tuple(self._rarfile.namelist())
+        return self._name_tuple
+
+    def __contains__(self, member: StrPath | ArchiveMember) -> bool:
+        return get_member_name(member) in self._name_set()
 
     def print_tree(
         self,
@@ -183,8 +200,7 @@ class RarFileAdapter(BaseArchiveAdapter):
         richprint(table)
 
     def extract(self, member: StrPath | ArchiveMember, *, destination: StrPath = Path.cwd()) -> Path:
-        destination = realpath(destination)
-        destination.mkdir(parents=True, exist_ok=True)
+        destination = ensure_destination(destination)
 
         name = get_member_name(member)
 
@@ -198,26 +214,47 @@ class RarFileAdapter(BaseArchiveAdapter):
         return destination / name
 
     def extractall(
-        self, *, destination: StrPath = Path.cwd(), members: CollectionOf[StrPath | ArchiveMember] | None = None
+        self,
+        *,
+        destination: StrPath = Path.cwd(),
+        members: CollectionOf[StrPath | ArchiveMember] | None = None,
+        workers: int | None = None,
     ) -> Path:
-        destination = realpath(destination)
-        destination.mkdir(parents=True, exist_ok=True)
+        destination = ensure_destination(destination)
 
-        names: set[str] = set()
+        names: list[str] = []
         if members:
-            all_members = self._rarfile.namelist()
-            for member in members:
-                name = get_member_name(member)
-                if name in all_members:
-                    names.add(name)
-                else:
-                    raise KeyError(f"{name} not found in {self._file}")
+            names = validate_members((get_member_name(member) for member in members), self._name_set(), self._file)
+
+        # Every member of a solid archive depends on the ones before it, so each worker's unrar process would have
+        # to decompress the stream from the start. That's no faster than extracting it once, so we stay serial.
+        if workers is not None and workers > 1 and not self._rarfile.is_solid():
+            # Directories are left for last so their timestamps aren't clobbered by files being written into them
+            dirs: list[str] = []
+            files: list[str] = []
+            for name in names or self._rarfile.namelist():
+                (dirs if name.endswith("/") else files).append(name)
+
+            workers = min(workers, len(files))
+            with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+                futures = [executor.submit(self._extract_chunk, files[i::workers], destination) for i in range(workers)]
+                for future in futures:
+                    future.result()
+
+            if dirs:
+                self._rarfile.extractall(path=destination, members=dirs, pwd=self._password)
+        elif names:
             self._rarfile.extractall(path=destination, members=names, pwd=self._password)
         else:
             self._rarfile.extractall(path=destination, pwd=self._password)
 
         return destination
 
+    def _extract_chunk(self, names: list[str], destination: Path) -> None:
+        # Every worker opens its own RarFile so they don't end up sharing any parser or file state
+        with RarFile(self._file, mode=self._mode, **self._kwargs) as rarfile:
+            rarfile.extractall(path=destination, members=names, pwd=self._password)
+
     def read_bytes(self, member: StrPath | ArchiveMember) -> bytes:
         name = get_member_name(member)
 
@@ -231,6 +268,9 @@ class RarFileAdapter(BaseArchiveAdapter):
         except NoRarEntry:
             raise KeyError(f"{name} not found in {self._file}")
 
+    def read_many(self, members: CollectionOf[StrPath | ArchiveMember]) -> dict[str, bytes]:
+        return {get_member_name(member): self.read_bytes(member) for member in members}
+
     def read_text(
         self,
         member: StrPath | ArchiveMember,
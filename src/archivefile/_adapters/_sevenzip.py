@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+from io import BytesIO
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, overload
 
 from archivefile._adapters._base import BaseArchiveAdapter
 from archivefile._models import ArchiveMember
-from archivefile._utils import get_member_name, realpath
+from archivefile._utils import ensure_destination, get_member_name, realpath, validate_members
 from py7zr import SevenZipFile
 
 if TYPE_CHECKING:
@@ -22,9 +23,23 @@ if TYPE_CHECKING:
         TableStyle,
         TreeStyle,
     )
+    from typing import IO
+
+    from py7zr.py7zr import FileInfo
     from typing_extensions import Generator, Self
 
 
+def _read_buffer(fileobj: IO[bytes] | None) -> bytes:
+    # SevenZipFile.read hands back BytesIO buffers, whose contents we can take directly instead of relying on
+    # their stream position. Anything else is rewound and read in full.
+    if fileobj is None:
+        return b""
+    if isinstance(fileobj, BytesIO):
+        return fileobj.getvalue()
+    fileobj.seek(0)
+    return fileobj.read()
+
+
 class SevenZipFileAdapter(BaseArchiveAdapter):
     # fmt: off
     @overload
@@ -72,6 +87,11 @@ class SevenZipFileAdapter(BaseArchiveAdapter):
             self._mode = "w"
 
         self._sevenzipfile = SevenZipFile(self._file, mode=self._mode, password=self._password, **kwargs)
+        self._name_tuple: tuple[str, ...] | None = None
+        self._names: frozenset[str] | None = None
+        self._info_map: dict[str, FileInfo] | None = None
+        # Whether SevenZipFile has been read from since it was last reset, see `_ensure_ready`
+        self._dirty = False
 
     def __enter__(self) -> Self:
         return self
@@ -109,14 +129,36 @@ class SevenZipFileAdapter(BaseArchiveAdapter):
     def adapter(self) -> str:
         return self.__class__.__name__
 
+    def _ensure_ready(self) -> None:
+        # SevenZipFile can only be read from once before it has to be reset. Resetting right after every read
+        # is wasted work when nothing else gets read (e.g, the archive gets closed next), so we put it off
+        # until the next read instead. This is called right before anything that reads from the archive.
+        if self._dirty:
+            self._sevenzipfile.reset()
+            self._dirty = False
+
+    def _name_set(self) -> frozenset[str]:
+        # Same names as `get_names`, but for membership tests. This is reset whenever something is written to the archive.
+        if self._names is None:
+            self._names = frozenset(self.get_names())
+        return self._names
+
+    def _infos(self) -> dict[str, FileInfo]:
+        # SevenZipFile doesn't have an equivalent for `getinfo` like the rest, so we build our own index instead
+        # of scanning `SevenZipFile.list()` on every lookup. Like `_name_set`, this is reset on writes.
+        if self._info_map is None:
+            self._info_map = {}
+            for sevenzipinfo in self._sevenzipfile.list():
+                # Keep the first entry if a name is repeated, same as a linear search would
+                self._info_map.setdefault(sevenzipinfo.filename, sevenzipinfo)
+        return self._info_map
+
     def get_member(self, member: StrPath | ArchiveMember) -> ArchiveMember:
         # Unlike the rest, SevenZip member directories do not end with `/`, so we need to strip it out
         # i.e, `spam/eggs/` in a ZipFile is equivalent to `spam/eggs` in SevenZipFile
         name = get_member_name(member).removesuffix("/")
 
-        # SevenZipFile doesn't have an equivalent for `get_member` like the rest, so we hand craft it instead
-        # https://more-itertools.readthedocs.io/en/stable/_modules/more_itertools/recipes.html#first_true
-        sevenzipinfo = next(filter(lambda mem: mem.filename == name, self._sevenzipfile.list()), None)
+        sevenzipinfo = self._infos().get(name)
 
         # ZipFile and TarFile raise KeyError
         # So for consistency (and because I like KeyError over None), we'll also raise KeyError here
@@ -150,7 +192,16 @@ class SevenZipFileAdapter(BaseArchiveAdapter):
             )
 
     def get_names(self) -> tuple[str, ...]:
-        return tuple(self._sevenzipfile.getnames())
+        # getnames() walks every file in the archive, so we only do it once and hand out the same tuple
+        # until something is written to the archive.
+        if self._name_tuple is None:
+            self._name_tuple = tuple(self._sevenzipfile.getnames())
+        return self._name_tuple
+
+    def __contains__(self, member: StrPath | ArchiveMember) -> bool:
+        # Unlike the rest, SevenZip member directories do not end with `/`, so we need to strip it out
+        # i.e, `spam/eggs/` in a ZipFile is equivalent to `spam/eggs` in SevenZipFile
+        return get_member_name(member).removesuffix("/") in self._name_set()
 
     def print_tree(
         self,
@@ -204,47 +255,48 @@ class SevenZipFileAdapter(BaseArchiveAdapter):
         richprint(table)
 
     def extract(self, member: StrPath | ArchiveMember, *, destination: StrPath = Path.cwd()) -> Path:
-        destination = realpath(destination)
-        destination.mkdir(parents=True, exist_ok=True)
+        destination = ensure_destination(destination)
 
         # Unlike the rest, SevenZip member directories do not end with `/`, so we need to strip it out
         # i.e, `spam/eggs/` in a ZipFile is equivalent to `spam/eggs` in SevenZipFile
         name = get_member_name(member).removesuffix("/")
 
-        if name in self.get_names():
+        if name in self._name_set():
+            self._ensure_ready()
+            self._dirty = True
             self._sevenzipfile.extract(path=destination, targets=[name], recursive=True)
         else:
             # ZipFile and TarFile raise KeyError but SevenZipFile does nothing
             # So for consistency's sake, we'll also raise KeyError here
             raise KeyError(f"{name} not found in {self._file}")
 
-        self._sevenzipfile.reset()
         return destination / name
 
     def extractall(
-        self, *, destination: StrPath = Path.cwd(), members: CollectionOf[StrPath | ArchiveMember] | None = None
+        self,
+        *,
+        destination: StrPath = Path.cwd(),
+        members: CollectionOf[StrPath | ArchiveMember] | None = None,
+        workers: int | None = None,
     ) -> Path:
-        destination = realpath(destination)
-        destination.mkdir(parents=True, exist_ok=True)
+        # SevenZipFile already decompresses independent folders in parallel on its own, so `workers` is unused
+        destination = ensure_destination(destination)
 
-        names: set[str] = set()
+        names: list[str] = []
         if members:
-            all_members = self._sevenzipfile.getnames()
-            for member in members:
-                # Unlike the rest, SevenZip member directories do not end with `/`, so we need to strip it out
-                # i.e, `spam/eggs/` in a ZipFile is equivalent to `spam/eggs` in SevenZipFile
-                name = get_member_name(member).removesuffix("/")
-                if name in all_members:
-                    names.add(name)
-                else:
-                    raise KeyError(f"{name} not found in {self._file}")
+            # Unlike the rest, SevenZip member directories do not end with `/`, so we need to strip it out
+            # i.e, `spam/eggs/` in a ZipFile is equivalent to `spam/eggs` in SevenZipFile
+            names = validate_members(
+                (get_member_name(member).removesuffix("/") for member in members), self._name_set(), self._file
+            )
 
+        self._ensure_ready()
+        self._dirty = True
         if names:
             self._sevenzipfile.extract(path=destination, targets=names, recursive=True)
         else:
             self._sevenzipfile.extractall(path=destination)
 
-        self._sevenzipfile.reset()
         return destination
 
     def read_bytes(self, member: StrPath | ArchiveMember) -> bytes:
@@ -252,24 +304,46 @@ class SevenZipFileAdapter(BaseArchiveAdapter):
         # i.e, `spam/eggs/` in a ZipFile is equivalent to `spam/eggs` in SevenZipFile
         name = get_member_name(member).removesuffix("/")
 
-        if name not in self._sevenzipfile.getnames():
+        sevenzipinfo = self._infos().get(name)
+
+        if sevenzipinfo is None:
             raise KeyError(f"{name} not found in {self._file}")
 
+        if sevenzipinfo.is_directory:
+            # Nothing to decompress
+            return b""
+
+        self._ensure_ready()
+        self._dirty = True
         data = self._sevenzipfile.read(targets=[name])
-        self._sevenzipfile.reset()
-
-        match data:
-            case dict():
-                if fileobj := data.get(name):
-                    return fileobj.read()  # type: ignore
-                else:
-                    return b""
-            case _:  # pragma: no cover
-                # We need this because SevenZipFile.read is typed as `dict | None`
-                # but this case will never actually happen.
-                # I couldn't get SevenZipFile to return anything but a dict,
-                # so I'm assuming it's some edge case.
-                return b""
+
+        return _read_buffer(data.get(name) if data else None)
+
+    def read_many(self, members: CollectionOf[StrPath | ArchiveMember]) -> dict[str, bytes]:
+        # Maps the name we were given to the name as it's stored in the archive
+        names: dict[str, str] = {}
+        for member in members:
+            key = get_member_name(member)
+            # Unlike the rest, SevenZip member directories do not end with `/`, so we need to strip it out
+            # i.e, `spam/eggs/` in a ZipFile is equivalent to `spam/eggs` in SevenZipFile
+            name = key.removesuffix("/")
+            if name not in self._name_set():
+                raise KeyError(f"{name} not found in {self._file}")
+            names[key] = name
+
+        if not names:
+            return {}
+
+        # Reading everything in one go means each (solid) block only gets decompressed once,
+        # as opposed to once per member if we were to call `read_bytes` in a loop.
+        self._ensure_ready()
+        self._dirty = True
+        data = self._sevenzipfile.read(targets=list(names.values())) or {}
+
+        result: dict[str, bytes] = {}
+        for key, name in names.items():
+            result[key] = _read_buffer(data.get(name))
+        return result
 
     def read_text(
         self,
@@ -298,6 +372,9 @@ class SevenZipFileAdapter(BaseArchiveAdapter):
             raise ValueError(f"The specified file '{file}' either does not exist or is not a regular file!")
 
         self._sevenzipfile.write(file, arcname=arcname)
+        self._name_tuple = None
+        self._names = None
+        self._info_map = None
 
     def write_text(
         self,
@@ -306,6 +383,9 @@ class SevenZipFileAdapter(BaseArchiveAdapter):
         arcname: StrPath,
     ) -> None:
         self._sevenzipfile.writestr(data=data, arcname=get_member_name(arcname))
+        self._name_tuple = None
+        self._names = None
+        self._info_map = None
 
     def write_bytes(
         self,
@@ -314,6 +394,9 @@ class SevenZipFileAdapter(BaseArchiveAdapter):
         arcname: StrPath,
     ) -> None:
         self._sevenzipfile.writestr(data=data, arcname=get_member_name(arcname))
+        self._name_tuple = None
+        self._names = None
+        self._info_map = None
 
     def writeall(
         self,
@@ -344,6 +427,7 @@ class SevenZipFileAdapter(BaseArchiveAdapter):
 
     def close(self) -> None:
         self._sevenzipfile.close()  # type: ignore
+        self._info_map = None
 
     def __repr__(self) -> str:
         password = '"********"' if self.password else None
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any, overload
 
 from archivefile._adapters._base import BaseArchiveAdapter
 from archivefile._models import ArchiveMember
-from archivefile._utils import get_member_name, realpath
+from archivefile._utils import ensure_destination, get_member_name, realpath
 
 if TYPE_CHECKING:
     from types import TracebackType
@@ -25,6 +25,9 @@ if TYPE_CHECKING:
     )
     from typing_extensions import Generator, Self
 
+# https://docs.python.org/3/library/tarfile.html#supporting-older-python-versions
+_DATA_FILTER = getattr(tarfile, "data_filter", (lambda member, path: member))
+
 
 class TarFileAdapter(BaseArchiveAdapter):
     # fmt: off
@@ -55,8 +58,9 @@ class TarFileAdapter(BaseArchiveAdapter):
         self._mode = mode
         self._password = password
         self._tarfile = tarfile.open(self._file, mode=self._mode, **kwargs)
-        # https://docs.python.org/3/library/tarfile.html#supporting-older-python-versions
-        self._tarfile.extraction_filter = getattr(tarfile, "data_filter", (lambda member, path: member))
+        self._tarfile.extraction_filter = _DATA_FILTER
+        self._name_tuple: tuple[str, ...] | None = None
+        self._info_map: dict[str, tarfile.TarInfo] | None = None
 
     def __enter__(self) -> Self:
         return self
@@ -94,10 +98,22 @@ class TarFileAdapter(BaseArchiveAdapter):
     def adapter(self) -> str:
         return self.__class__.__name__
 
+    def _getinfo(self, name: str) -> tarfile.TarInfo:
+        # TarFile.getmember scans every member (from the end) on each call, so we build our own index instead.
+        # Later entries overwrite earlier ones, so a repeated name resolves to its last occurrence just like
+        # TarFile.getmember. This is reset whenever something is written to the archive.
+        if self._info_map is None:
+            self._info_map = {tarinfo.name: tarinfo for tarinfo in self._tarfile.getmembers()}
+
+        tarinfo = self._info_map.get(name.rstrip("/"))
+        if tarinfo is None:
+            raise KeyError(f"{name} not found in {self._file}")
+        return tarinfo
+
     def get_member(self, member: StrPath | ArchiveMember) -> ArchiveMember:
         name = get_member_name(member)
 
-        tarinfo = self._tarfile.getmember(name)
+        tarinfo = self._getinfo(name)
 
         return ArchiveMember(
             name=tarinfo.name,
@@ -122,7 +138,17 @@ class TarFileAdapter(BaseArchiveAdapter):
             )
 
     def get_names(self) -> tuple[str, ...]:
-        return tuple(self._tarfile.getnames())
+        # Hand out the same tuple until something is written to the archive
+        if self._name_tuple is None:
+            self._name_tuple = tuple(self._tarfile.getnames())
+        return self._name_tuple
+
+    def __contains__(self, member: StrPath | ArchiveMember) -> bool:
+        try:
+            self._getinfo(get_member_name(member))
+        except KeyError:
+            return False
+        return True
 
     def print_tree(
         self,
@@ -176,23 +202,26 @@ class TarFileAdapter(BaseArchiveAdapter):
         richprint(table)
 
     def extract(self, member: StrPath | ArchiveMember, *, destination: StrPath = Path.cwd()) -> Path:
-        destination = realpath(destination)
-        destination.mkdir(parents=True, exist_ok=True)
+        destination = ensure_destination(destination)
 
         name = get_member_name(member)
-        self._tarfile.extract(member=name, path=destination)
+        self._tarfile.extract(member=self._getinfo(name), path=destination)
         return destination / name
 
     def extractall(
-        self, *, destination: StrPath = Path.cwd(), members: CollectionOf[StrPath | ArchiveMember] | None = None
+        self,
+        *,
+        destination: StrPath = Path.cwd(),
+        members: CollectionOf[StrPath | ArchiveMember] | None = None,
+        workers: int | None = None,
     ) -> Path:
-        destination = realpath(destination)
-        destination.mkdir(parents=True, exist_ok=True)
+        # TarFile is a single sequential stream, so `workers` doesn't apply here
+        destination = ensure_destination(destination)
 
         names: list[tarfile.TarInfo] = []
         if members:
             for member in members:
-                names.append(self._tarfile.getmember(get_member_name(member)))
+                names.append(self._getinfo(get_member_name(member)))
 
             self._tarfile.extractall(path=destination, members=names)
 
@@ -203,11 +232,16 @@ class TarFileAdapter(BaseArchiveAdapter):
 
     def read_bytes(self, member: StrPath | ArchiveMember) -> bytes:
         name = get_member_name(member)
-        fileobj = self._tarfile.extractfile(name)
+        fileobj = self._tarfile.extractfile(self._getinfo(name))
         if fileobj is None:  # pragma: no cover
             return b""
+        # A single unsized read() is deliberate. TarFile's `readinto` is implemented on top of `read` plus a copy,
+        # so reading into a preallocated buffer (or passing the member size) is measurably slower, not faster.
         return fileobj.read()
 
+    def read_many(self, members: CollectionOf[StrPath | ArchiveMember]) -> dict[str, bytes]:
+        return {get_member_name(member): self.read_bytes(member) for member in members}
+
     def read_text(
         self,
         member: StrPath | ArchiveMember,
@@ -232,6 +266,8 @@ class TarFileAdapter(BaseArchiveAdapter):
             raise ValueError(f"The specified file '{file}' either does not exist or is not a regular file!")
 
         self._tarfile.add(file, arcname=arcname)
+        self._name_tuple = None
+        self._info_map = None
 
     def write_text(
         self,
@@ -250,6 +286,8 @@ class TarFileAdapter(BaseArchiveAdapter):
         tarinfo = tarfile.TarInfo(get_member_name(arcname))
         tarinfo.size = len(data)
         self._tarfile.addfile(tarinfo, BytesIO(data))
+        self._name_tuple = None
+        self._info_map = None
 
     def writeall(
         self,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, overload
@@ -8,7 +9,7 @@ from zipfile import ZipFile
 from archivefile._adapters._base import BaseArchiveAdapter
 from archivefile._enums import CompressionType
 from archivefile._models import ArchiveMember
-from archivefile._utils import clamp_compression_level, get_member_name, realpath
+from archivefile._utils import clamp_compression_level, ensure_destination, get_member_name, realpath
 
 if TYPE_CHECKING:
     from types import TracebackType
@@ -55,6 +56,7 @@ class ZipFileAdapter(BaseArchiveAdapter):
         self._mode = mode[0]
         self._password = password
         self._pwd = password.encode() if password else None
+        self._kwargs = kwargs
 
         self._compression_type = CompressionType.get(compression_type)
         self._compression_level = clamp_compression_level(compression_level) if compression_level is not None else None
@@ -71,6 +73,7 @@ class ZipFileAdapter(BaseArchiveAdapter):
             compresslevel=self._compression_level,
             **kwargs,
         )  # type: ignore
+        self._name_tuple: tuple[str, ...] | None = None
 
     def __enter__(self) -> Self:
         return self
@@ -108,30 +111,40 @@ class ZipFileAdapter(BaseArchiveAdapter):
         name = get_member_name(member)
         zipinfo = self._zipfile.getinfo(name)
 
+        is_dir = zipinfo.is_dir()
         return ArchiveMember(
             name=zipinfo.filename,
             size=zipinfo.file_size,
             compressed_size=zipinfo.compress_size,
             datetime=datetime(*zipinfo.date_time),
             checksum=zipinfo.CRC,
-            is_dir=zipinfo.is_dir(),
-            is_file=not zipinfo.is_dir(),
+            is_dir=is_dir,
+            is_file=not is_dir,
         )
 
     def get_members(self) -> Generator[ArchiveMember]:
         for zipinfo in self._zipfile.filelist:
+            is_dir = zipinfo.is_dir()
             yield ArchiveMember(
                 name=zipinfo.filename,
                 size=zipinfo.file_size,
                 compressed_size=zipinfo.compress_size,
                 datetime=datetime(*zipinfo.date_time),
                 checksum=zipinfo.CRC,
-                is_dir=zipinfo.is_dir(),
-                is_file=not zipinfo.is_dir(),
+                is_dir=is_dir,
+                is_file=not is_dir,
             )
 
     def get_names(self) -> tuple[str, ...]:
-        return tuple(self._zipfile.namelist())
+        # namelist() builds a new list on every call, so we hand out the same tuple
+        # until something is written to the archive.
+        if self._name_tuple is None:
+            self._name_tuple = tuple(self._zipfile.namelist())
+        return self._name_tuple
+
+    def __contains__(self, member: StrPath | ArchiveMember) -> bool:
+        # ZipFile already keeps a name -> ZipInfo index for `getinfo`, so this is just a dict lookup
+        return get_member_name(member) in self._zipfile.NameToInfo
 
     def print_tree(
         self,
@@ -185,35 +198,62 @@ class ZipFileAdapter(BaseArchiveAdapter):
         richprint(table)
 
     def extract(self, member: StrPath | ArchiveMember, *, destination: StrPath = Path.cwd()) -> Path:
-        destination = realpath(destination)
-        destination.mkdir(parents=True, exist_ok=True)
+        destination = ensure_destination(destination)
 
         name = get_member_name(member)
         self._zipfile.extract(member=name, path=destination, pwd=self._pwd)
         return destination / name
 
     def extractall(
-        self, *, destination: StrPath = Path.cwd(), members: CollectionOf[StrPath | ArchiveMember] | None = None
+        self,
+        *,
+        destination: StrPath = Path.cwd(),
+        members: CollectionOf[StrPath | ArchiveMember] | None = None,
+        workers: int | None = None,
     ) -> Path:
-        destination = realpath(destination)
-        destination.mkdir(parents=True, exist_ok=True)
+        destination = ensure_destination(destination)
 
         names: list[str] = []
         if members:
             for member in members:
                 names.append(get_member_name(member))
 
-        if names:
+        # Every worker reopens the archive from disk, which only matches our ZipFile when it's opened for reading.
+        # In any other mode there may be pending writes (or no central directory yet), so we stay serial.
+        if workers is not None and workers > 1 and self._mode == "r":
+            names = names or self._zipfile.namelist()
+            workers = max(min(workers, len(names)), 1)
+            # Every member is compressed on its own and zlib/bz2/lzma release the GIL while decompressing,
+            # so we can spread the members across a few threads.
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(self._extract_chunk, names[i::workers], destination) for i in range(workers)]
+                for future in futures:
+                    future.result()
+        elif names:
             self._zipfile.extractall(path=destination, members=names, pwd=self._pwd)
         else:
             self._zipfile.extractall(path=destination, pwd=self._pwd)
 
         return destination
 
+    def _extract_chunk(self, names: list[str], destination: Path) -> None:
+        # ZipFile handles aren't meant to be shared across threads, so every worker opens its own
+        with ZipFile(self._file, **self._kwargs) as zipfile:
+            for name in names:
+                try:
+                    zipfile.extract(member=name, path=destination, pwd=self._pwd)
+                except FileExistsError:
+                    # Another worker created one of the parent directories between ZipFile's
+                    # existence check and its call to `os.makedirs`, so we just try again.
+                    zipfile.extract(member=name, path=destination, pwd=self._pwd)
+
     def read_bytes(self, member: StrPath | ArchiveMember) -> bytes:
         name = get_member_name(member)
         return self._zipfile.read(name, pwd=self._pwd)  # type: ignore
 
+    def read_many(self, members: CollectionOf[StrPath | ArchiveMember]) -> dict[str, bytes]:
+        return {get_member_name(member): self.read_bytes(member) for member in members}
+
     def read_text(
         self,
         member: StrPath | ArchiveMember,
@@ -238,6 +278,7 @@ class ZipFileAdapter(BaseArchiveAdapter):
             raise ValueError(f"The specified file '{file}' either does not exist or is not a regular file!")
 
         self._zipfile.write(file, arcname=arcname)
+        self._name_tuple = None
 
     def write_text(
         self,
@@ -246,6 +287,7 @@ class ZipFileAdapter(BaseArchiveAdapter):
         arcname: StrPath,
     ) -> None:
         self._zipfile.writestr(get_member_name(arcname), data)
+        self._name_tuple = None
 
     def write_bytes(
         self,
@@ -254,6 +296,7 @@ class ZipFileAdapter(BaseArchiveAdapter):
         arcname: StrPath,
     ) -> None:
         self._zipfile.writestr(get_member_name(arcname), data)
+        self._name_tuple = None
 
     def writeall(
         self,
@@ -2,21 +2,13 @@ from __future__ import annotations
 
 import re
 from pathlib import Path
-from tarfile import is_tarfile
 from types import TracebackType
-from typing import Any, overload
-from zipfile import is_zipfile
+from typing import Any, Literal, overload
 
-from py7zr import is_7zfile
 from pydantic import validate_call
-from rarfile import is_rarfile, is_rarfile_sfx
 from typing_extensions import Generator, Self
 
 from archivefile._adapters._base import BaseArchiveAdapter
-from archivefile._adapters._rar import RarFileAdapter
-from archivefile._adapters._sevenzip import SevenZipFileAdapter
-from archivefile._adapters._tar import TarFileAdapter
-from archivefile._adapters._zip import ZipFileAdapter
 from archivefile._enums import CompressionType
 from archivefile._models import ArchiveMember
 from archivefile._types import (
@@ -29,7 +21,7 @@ from archivefile._types import (
     TableStyle,
     TreeStyle,
 )
-from archivefile._utils import realpath
+from archivefile._utils import detect_format, is_up_to_date, realpath
 
 
 class ArchiveFile(BaseArchiveAdapter):
@@ -108,37 +100,50 @@ class ArchiveFile(BaseArchiveAdapter):
         self._initialize_adapter()
 
     def _initialize_adapter(self) -> None:
+        adapter: type[BaseArchiveAdapter]
+        fmt: Literal["zip", "tar", "7z", "rar"] | None
+
         if not self._file.exists():
             if not self._mode.startswith("r"):
                 filename = self._file.name.lower()
 
                 if re.search(r"\.(zip|cbz)$", filename):
-                    adapter = ZipFileAdapter
+                    fmt = "zip"
                 elif re.search(r"\.((tar(\.(bz2|gz|xz))?)|(cbt))$", filename):
-                    adapter = TarFileAdapter  # type: ignore
+                    fmt = "tar"
                 elif re.search(r"\.(7z|cb7)$", filename):
-                    adapter = SevenZipFileAdapter  # type: ignore
+                    fmt = "7z"
                 elif re.search(r"\.(rar|cbr)$", filename):
-                    adapter = RarFileAdapter  # type: ignore
+                    fmt = "rar"
                 else:
-                    raise NotImplementedError(f"Unsupported archive format: {self._file}")
+                    fmt = None
             else:
                 raise FileNotFoundError(self._file)
 
-        elif is_zipfile(self._file):
-            adapter = ZipFileAdapter
+        else:
+            fmt = detect_format(self._file)
 
-        elif is_tarfile(self._file):
-            adapter = TarFileAdapter  # type: ignore
+        # Adapters are imported on demand so that we only pay for
+        # the libraries (and their compression modules) we actually need.
+        match fmt:
+            case "zip":
+                from archivefile._adapters._zip import ZipFileAdapter
 
-        elif is_7zfile(self._file):
-            adapter = SevenZipFileAdapter  # type: ignore
+                adapter = ZipFileAdapter
+            case "tar":
+                from archivefile._adapters._tar import TarFileAdapter
 
-        elif is_rarfile(self._file) or is_rarfile_sfx(self._file):
-            adapter = RarFileAdapter  # type: ignore
+                adapter = TarFileAdapter
+            case "7z":
+                from archivefile._adapters._sevenzip import SevenZipFileAdapter
 
-        else:
-            raise NotImplementedError(f"Unsupported archive format: {self._file}")
+                adapter = SevenZipFileAdapter
+            case "rar":
+                from archivefile._adapters._rar import RarFileAdapter
+
+                adapter = RarFileAdapter
+            case _:
+                raise NotImplementedError(f"Unsupported archive format: {self._file}")
 
         self._adapter = adapter(
             self._file,
@@ -148,6 +153,8 @@ class ArchiveFile(BaseArchiveAdapter):
             compression_level=self._compression_level,
             **self._kwargs,
         )
+        # ZipFile is the only one that doesn't restore modification times on extraction
+        self._restores_mtime = fmt != "zip"
 
     def __enter__(self) -> Self:
         return self
@@ -268,6 +275,38 @@ class ArchiveFile(BaseArchiveAdapter):
         """
         return self._adapter.get_names()
 
+    def __contains__(self, member: object) -> bool:
+        """
+        Check whether a member exists in the archive.
+
+        Parameters
+        ----------
+        member : StrPath | ArchiveMember
+            Name of the member or an ArchiveMember object.
+
+        Returns
+        -------
+        bool
+            True if the member is in the archive, False otherwise.
+
+        Notes
+        -----
+        This is a hash lookup for every supported archive format, so prefer it over `name in archive.get_names()`.
+
+        Examples
+        --------
+        ```py
+        from archivefile import ArchiveFile
+
+        with ArchiveFile("source.zip") as archive:
+            "hello-world/pyproject.toml" in archive
+            # True
+        ```
+        """
+        if not isinstance(member, (str, Path, ArchiveMember)):
+            return False
+        return self._adapter.__contains__(member)
+
     def print_tree(
         self,
         *,
@@ -380,7 +419,13 @@ class ArchiveFile(BaseArchiveAdapter):
         self._adapter.print_table(title=title, style=style, sort_by=sort_by, descending=descending, **kwargs)
 
     @validate_call
-    def extract(self, member: StrPath | ArchiveMember, *, destination: StrPath = Path.cwd()) -> Path:
+    def extract(
+        self,
+        member: StrPath | ArchiveMember,
+        *,
+        destination: StrPath = Path.cwd(),
+        skip_existing: bool = False,
+    ) -> Path:
         """
         Extract a member of the archive.
 
@@ -391,6 +436,10 @@ class ArchiveFile(BaseArchiveAdapter):
         destination : StrPath
             The path to the directory where the member will be extracted.
             If not specified, the current working directory is used as the default destination.
+        skip_existing : bool, optional
+            Skip the member if it has already been extracted to the destination, i.e, a file with the same size
+            and modification time as the member already exists there. Zip archives don't restore modification
+            times, so for those a file with the same size that is at least as new as the member is enough.
 
         Returns
         -------
@@ -402,6 +451,11 @@ class ArchiveFile(BaseArchiveAdapter):
         KeyError
             Raised if the member is not found in the archive.
 
+        Notes
+        -----
+        To extract several members from a 7z archive, pass them all to `extractall(members=...)` instead of
+        calling this in a loop. Otherwise a solid block is decompressed once for every member extracted from it.
+
         Examples
         --------
         ```py
@@ -418,11 +472,22 @@ class ArchiveFile(BaseArchiveAdapter):
             # packages = [{include = "hello_world", from = "src"}]
         ```
         """
+        if skip_existing:
+            archive_member = self._adapter.get_member(member)
+            destination = realpath(destination)
+            if is_up_to_date(archive_member, destination, restores_mtime=self._restores_mtime):
+                return destination / archive_member.name
+
         return self._adapter.extract(member, destination=destination)
 
     @validate_call
     def extractall(
-        self, *, destination: StrPath = Path.cwd(), members: CollectionOf[StrPath | ArchiveMember] | None = None
+        self,
+        *,
+        destination: StrPath = Path.cwd(),
+        members: CollectionOf[StrPath | ArchiveMember] | None = None,
+        workers: int | None = None,
+        skip_existing: bool = False,
     ) -> Path:
         """
         Extract all the members of the archive to the destination directory.
@@ -435,6 +500,13 @@ class ArchiveFile(BaseArchiveAdapter):
         members : CollectionOf[StrPath | ArchiveMember], optional
             Collection of member names or ArchiveMember objects to extract.
             Default is `None` which will extract all members.
+        workers : int, optional
+            Number of threads used to extract members concurrently.
+            Default is `None` which will extract members one at a time.
+        skip_existing : bool, optional
+            Skip members that have already been extracted to the destination, i.e, a file with the same size
+            and modification time as the member already exists there. Zip archives don't restore modification
+            times, so for those a file with the same size that is at least as new as the member is enough.
 
         Returns
         -------
@@ -446,6 +518,12 @@ class ArchiveFile(BaseArchiveAdapter):
         KeyError
             Raised if any member in members was not found in the archive.
 
+        Notes
+        -----
+        The `workers` parameter only has an effect on zip archives opened for reading and non-solid rar archives,
+        where every member is compressed independently. Tar archives and solid rar archives are a single stream,
+        and 7z archives are already decompressed in parallel by the underlying library.
+
         Examples
         --------
         ```py
@@ -466,7 +544,22 @@ class ArchiveFile(BaseArchiveAdapter):
             # /source/hello-world/tests/__init__.py
         ```
         """
-        return self._adapter.extractall(destination=destination, members=members)
+        if skip_existing:
+            destination = realpath(destination)
+            candidates = (
+                (self._adapter.get_member(member) for member in members) if members else self._adapter.get_members()
+            )
+            members = [
+                member.name
+                for member in candidates
+                if not is_up_to_date(member, destination, restores_mtime=self._restores_mtime)
+            ]
+            if not members:
+                # Nothing left to extract, and an empty `members` would mean "everything" to the adapter
+                destination.mkdir(parents=True, exist_ok=True)
+                return destination
+
+        return self._adapter.extractall(destination=destination, members=members, workers=workers)
 
     @validate_call
     def read_bytes(self, member: StrPath | ArchiveMember) -> bytes:
@@ -488,6 +581,11 @@ class ArchiveFile(BaseArchiveAdapter):
         KeyError
             Raised if the member is not found in the archive.
 
+        Notes
+        -----
+        To read several members from a 7z archive, use `read_many` instead of calling this in a loop.
+        Otherwise a solid block is decompressed once for every member read from it.
+
         Examples
         --------
         ```py
@@ -501,6 +599,45 @@ class ArchiveFile(BaseArchiveAdapter):
         """
         return self._adapter.read_bytes(member)
 
+    @validate_call
+    def read_many(self, members: CollectionOf[StrPath | ArchiveMember]) -> dict[str, bytes]:
+        """
+        Read multiple members in bytes mode.
+
+        Parameters
+        ----------
+        members : CollectionOf[StrPath | ArchiveMember]
+            Collection of member names or ArchiveMember objects to read.
+
+        Returns
+        -------
+        dict[str, bytes]
+            Mapping of member names to their contents as bytes.
+
+        Raises
+        ------
+        KeyError
+            Raised if any member in members was not found in the archive.
+
+        Notes
+        -----
+        This is the preferred way to read several members from a 7z archive.
+        All of them are decompressed in a single pass, whereas calling `read_bytes`
+        in a loop decompresses a solid block once for every member read from it.
+
+        Examples
+        --------
+        ```py
+        from archivefile import ArchiveFile
+
+        with ArchiveFile("source.7z") as archive:
+            data = archive.read_many(["hello-world/pyproject.toml", "hello-world/README.md"])
+            print(data["hello-world/README.md"])
+            # b"# hello-world"
+        ```
+        """
+        return self._adapter.read_many(members)
+
     @validate_call
     def read_text(
         self,
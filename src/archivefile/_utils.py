@@ -1,15 +1,26 @@
 from __future__ import annotations
 
+import os
+from functools import lru_cache
 from pathlib import Path
-from tarfile import is_tarfile
-from zipfile import is_zipfile
-
-from py7zr import is_7zfile
-from rarfile import is_rarfile, is_rarfile_sfx
+from stat import S_ISDIR, S_ISREG
+from typing import AbstractSet, Iterable, Literal
 
 from archivefile._models import ArchiveMember
 from archivefile._types import StrPath
 
+# Leading signatures of the formats we support, checked with a single small read before
+# falling back to the library validators, which each open and parse the file on their own.
+_MAGIC: dict[bytes, Literal["zip", "tar", "7z", "rar"]] = {
+    b"PK\x03\x04": "zip",
+    b"7z\xbc\xaf\x27\x1c": "7z",
+    b"Rar!\x1a\x07\x00": "rar",
+    b"Rar!\x1a\x07\x01": "rar",
+}
+
+# gzip, bzip2, and xz only tell us the compression, not that there's a tarball inside
+_COMPRESSED_MAGIC = (b"\x1f\x8b", b"BZh", b"\xfd7zXZ\x00")
+
 
 def realpath(path: StrPath) -> Path:
     """
@@ -25,7 +36,128 @@ def realpath(path: StrPath) -> Path:
     Path
         The path after expanding the user's home directory and resolving any symbolic links.
     """
-    return path.expanduser().resolve() if isinstance(path, Path) else Path(path).expanduser().resolve()
+    # Same result as Path.resolve(), minus the extra stat() it makes to detect symlink loops
+    return Path(os.path.realpath(os.path.expanduser(path)))
+
+
+def ensure_destination(destination: StrPath) -> Path:
+    """
+    Resolve an extraction destination and make sure it exists.
+
+    Parameters
+    ----------
+    destination : StrPath
+        The directory to extract to.
+
+    Returns
+    -------
+    Path
+        The resolved destination.
+    """
+    destination = realpath(destination)
+    destination.mkdir(parents=True, exist_ok=True)
+    return destination
+
+
+def validate_members(names: Iterable[str], available: AbstractSet[str], file: Path) -> list[str]:
+    """
+    Deduplicate member names and make sure they're all in the archive.
+
+    Parameters
+    ----------
+    names : Iterable[str]
+        Member names, in the order they were given.
+    available : AbstractSet[str]
+        Names of every member in the archive.
+    file : Path
+        Path to the archive file, used in the error message.
+
+    Returns
+    -------
+    list[str]
+        The names without duplicates, in the order they were given.
+
+    Raises
+    ------
+    KeyError
+        Raised if any of the names is not found in the archive.
+    """
+    unique = dict.fromkeys(names)
+    # One set difference against the available names instead of a membership test per member
+    if missing := unique.keys() - available:
+        # Report the first missing name in the order it was given, so the error is deterministic
+        name = next(name for name in unique if name in missing)
+        raise KeyError(f"{name} not found in {file}")
+    return list(unique)
+
+
+def detect_format(file: Path) -> Literal["zip", "tar", "7z", "rar"] | None:
+    """
+    Detect the format of an archive file.
+
+    Parameters
+    ----------
+    file : Path
+        Path to the archive file.
+
+    Returns
+    -------
+    Literal["zip", "tar", "7z", "rar"] | None
+        The archive format, or None if the file is not a supported archive.
+
+    Raises
+    ------
+    OSError
+        Raised if the file cannot be opened.
+    """
+    # A file that hasn't been touched since we last looked at it is still the same format, so the result
+    # is cached against its absolute path and identity. The modification time alone isn't enough since it
+    # can be set by hand (e.g, copy2 or extracting an archive), but the change time can't.
+    file = file.absolute()
+    stat = file.stat()
+    if not S_ISREG(stat.st_mode):
+        # Directories, pipes, devices, etc. can't be archives, and opening some of them would block
+        return None
+    return _detect_format(file, stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=1024)
+def _detect_format(
+    file: Path, dev: int, ino: int, mtime_ns: int, ctime_ns: int, size: int
+) -> Literal["zip", "tar", "7z", "rar"] | None:
+    with open(file, "rb", buffering=0) as f:
+        header = f.read(262)
+
+    for magic, fmt in _MAGIC.items():
+        if header.startswith(magic):
+            return fmt
+
+    if header[257:262] == b"ustar":
+        return "tar"
+
+    # The library validators are imported on demand, since most files never get this far
+    from tarfile import is_tarfile
+
+    if header.startswith(_COMPRESSED_MAGIC):
+        return "tar" if is_tarfile(file) else None
+
+    # No known signature at the start of the file (e.g, empty zips or self-extracting archives),
+    # so let the libraries have a go at it.
+    from zipfile import is_zipfile
+
+    from py7zr import is_7zfile
+    from rarfile import is_rarfile, is_rarfile_sfx
+
+    if is_zipfile(file):
+        return "zip"
+    elif is_tarfile(file):
+        return "tar"
+    elif is_7zfile(file):
+        return "7z"
+    elif is_rarfile(file) or is_rarfile_sfx(file):
+        return "rar"
+    else:
+        return None
 
 
 def is_archive(file: StrPath) -> bool:
@@ -42,17 +174,20 @@ def is_archive(file: StrPath) -> bool:
     bool
         True if the archive is supported, False otherwise.
     """
-    file = realpath(file)
-
-    if file.exists():
-        return is_tarfile(file) or is_zipfile(file) or is_rarfile(file) or is_rarfile_sfx(file) or is_7zfile(file)
-    else:
+    try:
+        # Resolving symlinks isn't needed just to look at the file, detect_format's stat already follows them
+        return detect_format(Path(file).expanduser().absolute()) is not None
+    except OSError:
         return False
 
 
 def get_member_name(member: StrPath | ArchiveMember) -> str:
     """Get the member name from a string, path, or ArchiveMember"""
 
+    if isinstance(member, str):
+        # By far the most common case, so skip the pattern matching below
+        return member
+
     match member:
         case ArchiveMember():
             return member.name
@@ -69,3 +204,39 @@ def clamp_compression_level(level: int) -> int:
     Pretty simple method to clamp compression level to a valid range
     """
     return max(0, min(level, 9))
+
+
+def is_up_to_date(member: ArchiveMember, destination: Path, *, restores_mtime: bool = True) -> bool:
+    """
+    Check whether a member has already been extracted to the destination directory.
+
+    Parameters
+    ----------
+    member : ArchiveMember
+        The archive member.
+    destination : Path
+        The directory the member would be extracted to.
+    restores_mtime : bool, optional
+        Whether extracting the member restores its modification time.
+
+    Returns
+    -------
+    bool
+        True if the extracted member exists, has the same size, and has the same modification time as the member.
+        If `restores_mtime` is False, anything at least as new as the member is accepted instead.
+        Directories only need to exist.
+    """
+    try:
+        stat = (destination / member.name).stat()
+    except OSError:
+        return False
+
+    if member.is_dir:
+        return S_ISDIR(stat.st_mode)
+
+    if not S_ISREG(stat.st_mode) or stat.st_size != member.size:
+        return False
+
+    # Whole seconds, since some formats only store 2 second precision
+    mtime, expected = int(stat.st_mtime), int(member.datetime.timestamp())
+    return mtime == expected if restores_mtime else mtime >= expected
@@ -6,6 +6,8 @@ from zipfile import ZipFile
 
 import pytest
 from archivefile import ArchiveFile, ArchiveMember
+from archivefile._adapters._rar import RarFileAdapter
+from rarfile import RarFile
 
 files = (
     Path("tests/test_data/source_BEST.rar"),
@@ -62,14 +64,18 @@ def test_extract_by_member(file: Path, tmp_path: Path) -> None:
         assert outfile.is_file()
 
 
-@parametrize_files
-def test_extractall(file: Path, tmp_path: Path) -> None:
+@pytest.fixture(scope="module")
+def control_paths_rel(tmp_path_factory: pytest.TempPathFactory) -> tuple[Path, ...]:
+    # Extracted once with ZipFile and shared by every file test_extractall is parametrized over
     with ZipFile("tests/test_data/source_STORE.zip") as archive:
-        dest = tmp_path / uuid4().hex
+        dest = tmp_path_factory.mktemp("control")
         archive.extractall(path=dest)
         control = tuple((dest / "pyanilist-main").rglob("*"))
-        control_paths_rel = tuple(member.relative_to(dest) for member in control)
+        return tuple(member.relative_to(dest) for member in control)
+
 
+@parametrize_files
+def test_extractall(file: Path, tmp_path: Path, control_paths_rel: tuple[Path, ...]) -> None:
     with ArchiveFile(file) as archive:
         dest2 = tmp_path / uuid4().hex
         archive.extractall(destination=dest2)
@@ -100,3 +106,83 @@ def test_extractall_by_members(file: Path, tmp_path: Path) -> None:
         folder = archive.extractall(destination=tmp_path, members=members) / "pyanilist-main"  # type: ignore
         assert len(members) == len(tuple(folder.rglob("*"))) == 5
         assert sorted(expected) == sorted([member.relative_to(tmp_path).as_posix() for member in folder.rglob("*")])
+
+
+@parametrize_files
+def test_extractall_with_workers(file: Path, tmp_path: Path) -> None:
+    with ArchiveFile(file) as archive:
+        serial = archive.extractall(destination=tmp_path / "serial")
+        parallel = archive.extractall(destination=tmp_path / "parallel", workers=4)
+
+    expected = sorted(member.relative_to(serial).as_posix() for member in serial.rglob("*"))
+    assert expected == sorted(member.relative_to(parallel).as_posix() for member in parallel.rglob("*"))
+    for name in expected:
+        if (serial / name).is_file():
+            assert (serial / name).read_bytes() == (parallel / name).read_bytes()
+
+
+def test_extractall_with_workers_append_mode(tmp_path: Path) -> None:
+    file = tmp_path / "source_STORE.zip"
+    file.write_bytes(Path("tests/test_data/source_STORE.zip").read_bytes())
+
+    with ArchiveFile(file, "a") as archive:
+        outdir = archive.extractall(destination=tmp_path / "before", workers=4)
+        assert len(tuple(outdir.rglob("*"))) == 53
+
+        archive.write_text("spam", arcname="spam.txt")
+        outdir = archive.extractall(destination=tmp_path / "after", workers=4)
+        assert len(tuple(outdir.rglob("*"))) == 54
+        assert (outdir / "spam.txt").read_text() == "spam"
+
+
+def test_extractall_with_workers_solid_rar(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def extract_chunk(*args: object) -> None:
+        raise AssertionError("solid rar archives should be extracted serially")
+
+    monkeypatch.setattr(RarFile, "is_solid", lambda self: True)
+    monkeypatch.setattr(RarFileAdapter, "_extract_chunk", extract_chunk)
+
+    with ArchiveFile("tests/test_data/source_STORE.rar") as archive:
+        outdir = archive.extractall(destination=tmp_path, workers=4)
+        assert len(tuple(outdir.rglob("*"))) == 53
+
+
+@parametrize_files
+def test_extractall_skip_existing(file: Path, tmp_path: Path) -> None:
+    with ArchiveFile(file) as archive:
+        archive.extractall(destination=tmp_path)
+        readme = tmp_path / "pyanilist-main/README.md"
+        pyproject = tmp_path / "pyanilist-main/pyproject.toml"
+        expected = readme.read_bytes()
+        readme.write_text("modified")
+        untouched = pyproject.stat().st_mtime_ns
+
+        archive.extractall(destination=tmp_path, skip_existing=True)
+        assert readme.read_bytes() == expected
+        assert pyproject.stat().st_mtime_ns == untouched
+
+        # An empty `members` still means every member, skip_existing only filters
+        readme.write_text("modified")
+        archive.extractall(destination=tmp_path, members=[], skip_existing=True)
+        assert readme.read_bytes() == expected
+        assert pyproject.stat().st_mtime_ns == untouched
+
+        pyproject.unlink()
+        assert archive.extract("pyanilist-main/README.md", destination=tmp_path, skip_existing=True) == readme
+        assert archive.extract("pyanilist-main/pyproject.toml", destination=tmp_path, skip_existing=True).is_file()
+
+
+@parametrize_files
+def test_extractall_skip_existing_same_size_edit(file: Path, tmp_path: Path) -> None:
+    with ArchiveFile(file) as archive:
+        archive.extractall(destination=tmp_path)
+        readme = tmp_path / "pyanilist-main/README.md"
+        expected = readme.read_bytes()
+        readme.write_bytes(expected.swapcase())
+
+        archive.extractall(destination=tmp_path, skip_existing=True)
+        if file.suffix == ".zip":
+            # ZipFile doesn't restore modification times, so a newer file of the same size counts as extracted
+            assert readme.read_bytes() == expected.swapcase()
+        else:
+            assert readme.read_bytes() == expected
@@ -532,3 +532,26 @@ def test_get_member_dirs() -> None:
         assert member.checksum == 0
         assert member.is_dir is True
         assert member.is_file is False
+
+
+@parametrize_files
+def test_contains(file: Path) -> None:
+    with ArchiveFile(file) as archive:
+        assert "pyanilist-main/README.md" in archive
+        assert Path("pyanilist-main/README.md") in archive
+        assert all(member in archive for member in archive.get_members())
+        assert "non-existent-file.py" not in archive
+        assert 123 not in archive
+
+
+def test_get_member_tar_duplicate_name(tmp_path: Path) -> None:
+    file = tmp_path / "duplicate.tar"
+    with ArchiveFile(file, "w") as archive:
+        archive.write_text("old", arcname="spam.txt")
+        archive.write_text("newer", arcname="spam.txt")
+
+    # Like TarFile.getmember, the last occurrence of a repeated name wins
+    with ArchiveFile(file) as archive:
+        assert archive.get_member("spam.txt").size == 5
+        assert archive.read_text("spam.txt") == "newer"
+        assert archive.get_names() == ("spam.txt", "spam.txt")
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import tempfile
 from pathlib import Path
+from typing import IO
 
 import pytest
 from archivefile import ArchiveFile
+from py7zr import SevenZipFile
 
 files = (
     Path("tests/test_data/source_BEST.rar"),
@@ -90,3 +93,33 @@ def test_read_bytes_folder(file: Path) -> None:
     with ArchiveFile(file) as archive:
         member = archive.read_bytes("pyanilist-main/src/")
         assert member == b""
+
+
+@parametrize_files
+def test_read_many(file: Path) -> None:
+    with ArchiveFile(file) as archive:
+        data = archive.read_many(["pyanilist-main/UNLICENSE", Path("pyanilist-main/README.md"), "pyanilist-main/src/"])
+        assert tuple(data) == ("pyanilist-main/UNLICENSE", "pyanilist-main/README.md", "pyanilist-main/src/")
+        assert data["pyanilist-main/UNLICENSE"].decode().strip() == unlicense.strip()
+        assert data["pyanilist-main/README.md"] == archive.read_bytes("pyanilist-main/README.md")
+        assert data["pyanilist-main/src/"] == b""
+
+
+def test_read_sevenzip_non_bytesio(monkeypatch: pytest.MonkeyPatch) -> None:
+    read = SevenZipFile.read
+
+    def read_to_tempfile(self: SevenZipFile, targets: list[str] | None = None) -> dict[str, IO[bytes]]:
+        # Hand back real files, left at the end of their contents
+        data: dict[str, IO[bytes]] = {}
+        for name, buffer in (read(self, targets) or {}).items():
+            fileobj = tempfile.TemporaryFile()
+            fileobj.write(buffer.getvalue())
+            data[name] = fileobj
+        return data
+
+    monkeypatch.setattr(SevenZipFile, "read", read_to_tempfile)
+
+    with ArchiveFile("tests/test_data/source_LZMA2.7z") as archive:
+        assert archive.read_bytes("pyanilist-main/UNLICENSE").decode().strip() == unlicense.strip()
+        data = archive.read_many(["pyanilist-main/UNLICENSE"])
+        assert data["pyanilist-main/UNLICENSE"].decode().strip() == unlicense.strip()
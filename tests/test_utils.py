@@ -1,7 +1,20 @@
 from __future__ import annotations
 
+import os
+import shutil
+from pathlib import Path
+from zipfile import ZipFile
+
 import pytest
-from archivefile._utils import clamp_compression_level, is_archive
+from archivefile import ArchiveMember
+from archivefile._utils import (
+    clamp_compression_level,
+    detect_format,
+    ensure_destination,
+    get_member_name,
+    is_archive,
+    validate_members,
+)
 
 
 def test_is_archive() -> None:
@@ -9,6 +22,72 @@ def test_is_archive() -> None:
     assert is_archive("tests/test_data/source_PPMD.zip") is True
     assert is_archive("src/archivefile/__init__.py") is False
     assert is_archive("non-existent-file.py") is False
+    assert is_archive("tests/test_data") is False
+
+
+@pytest.mark.parametrize(
+    "file,expected",
+    [
+        (Path("tests/test_data/source_BEST.rar"), "rar"),
+        (Path("tests/test_data/source_STORE.7z"), "7z"),
+        (Path("tests/test_data/source_STORE.zip"), "zip"),
+        (Path("tests/test_data/source_GNU.tar"), "tar"),
+        (Path("tests/test_data/source_POSIX.tar"), "tar"),
+        (Path("tests/test_data/source_GNU.tar.bz2"), "tar"),
+        (Path("tests/test_data/source_POSIX.tar.gz"), "tar"),
+        (Path("tests/test_data/source_POSIX.tar.xz"), "tar"),
+        (Path("src/archivefile/__init__.py"), None),
+    ],
+    ids=lambda x: x.name if isinstance(x, Path) else x,
+)
+def test_detect_format(file: Path, expected: str | None) -> None:
+    assert detect_format(file) == expected
+
+
+def test_detect_format_without_signature(tmp_path: Path) -> None:
+    # An empty zip has no local file header, so it has to go through the library fallback
+    file = tmp_path / "empty.zip"
+    ZipFile(file, "w").close()
+    assert detect_format(file) == "zip"
+
+
+def test_detect_format_after_overwrite(tmp_path: Path) -> None:
+    file = tmp_path / "archive.zip"
+    ZipFile(file, "w").close()
+    assert detect_format(file) == "zip"
+    file.write_text("no longer an archive")
+    assert detect_format(file) is None
+
+
+def test_detect_format_same_size_and_mtime(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    archive = tmp_path / "zip" / "archive"
+    archive.parent.mkdir()
+    ZipFile(archive, "w").close()
+    other = tmp_path / "other" / "archive"
+    other.parent.mkdir()
+    other.write_bytes(b"\0" * archive.stat().st_size)
+    os.utime(other, ns=(archive.stat().st_atime_ns, archive.stat().st_mtime_ns))
+
+    # Same relative path, size, and modification time, but a different file
+    monkeypatch.chdir(archive.parent)
+    assert detect_format(Path("archive")) == "zip"
+    assert is_archive("archive") is True
+    monkeypatch.chdir(other.parent)
+    assert detect_format(Path("archive")) is None
+    assert is_archive("archive") is False
+
+    # Copied over in place with its modification time restored
+    shutil.copy2(other, archive)
+    assert archive.stat().st_mtime_ns == other.stat().st_mtime_ns
+    assert detect_format(archive) is None
+
+
+def test_get_member_name() -> None:
+    assert get_member_name("src/main.py") == "src/main.py"
+    assert get_member_name("src/main/") == "src/main/"
+    assert get_member_name(Path("src/main.py")) == "src/main.py"
+    assert get_member_name(Path("/src/main.py")) == "src/main.py"
+    assert get_member_name(ArchiveMember(name="src/main/")) == "src/main/"
 
 
 @pytest.mark.parametrize(
@@ -34,3 +113,21 @@ def test_is_archive() -> None:
 )
 def test_clamp_compression_level(level: int, expected: int) -> None:
     assert clamp_compression_level(level) == expected
+
+
+def test_ensure_destination(tmp_path: Path) -> None:
+    destination = ensure_destination(tmp_path / "spam/eggs")
+    assert destination.is_dir()
+
+    # Deleted destinations are created again
+    destination.rmdir()
+    assert ensure_destination(tmp_path / "spam/eggs") == destination
+    assert destination.is_dir()
+
+
+def test_validate_members() -> None:
+    available = frozenset(("spam", "eggs", "ham"))
+    assert validate_members(["eggs", "spam", "eggs"], available, Path("source.zip")) == ["eggs", "spam"]
+
+    with pytest.raises(KeyError, match="bacon not found in source.zip"):
+        validate_members(["spam", "bacon", "toast"], available, Path("source.zip"))